@@ -1,18 +1,76 @@
-import calendar
+import json
+from dataclasses import dataclass
 
-import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
 import streamlit as st
+import streamlit.components.v1 as components
 
 PRICE_PER_KWH = 0.2858  # in euro
-
-
-def get_data() -> pd.DataFrame:
+MONTH_NAMES: tuple[str, ...] = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+RADAR_LAYOUT = dict(
+    template="plotly_dark",
+    polar_angularaxis_rotation=90,
+    polar_angularaxis_direction="clockwise",
+    hovermode="x unified",
+    legend=dict(orientation="h"),
+)
+BAR_LAYOUT = dict(
+    template="plotly_dark",
+    showlegend=True,
+    legend=dict(orientation="h", y=-0.15),
+    yaxis=dict(range=[0, 105], ticksuffix="%"),
+)
+PLOTLY_CONFIG = dict(displayModeBar=False, responsive=True)
+PLOTLY_JS_URL = "https://cdn.plot.ly/plotly-2.32.0.min.js"  # matches plotly==5.22.0
+CHART_HEIGHT = 450  # in pixel
+
+INTRO_MD = (
+    'I tracked the energy production (and consumption) of my "Balkonkraftwerk" over a '
+    "full year. For the energy fed into grid I do not get disbursement so I tried to "
+    "self-consume as much energy as possible. Here are the results:"
+)
+CONCLUSION_MD = (
+    "I was able to self-consume about 70% of the energy produced by my solar panels over "
+    "the year. This number is highly dependent on the own energy consumption curve and might "
+    "be optimized further, e.g. by charging electrical devices during daytime and not at night."
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EnergyData:
+    """Monthly energy values of one year, one array per quantity (in kWh)."""
+
+    month_name: tuple[str, ...]
+    produced: np.ndarray
+    fed: np.ndarray
+    consumed: np.ndarray
+    relative: np.ndarray  # self-consumed share of produced energy, in percent
+    total_produced: float
+    total_consumed: float
+    relative_average: float  # in percent
+    cost_saved: float  # in euro
+    statistics_text: tuple[str, str, str]  # produced, consumed, cost saved
+
+
+@st.cache_data(ttl=None, show_spinner=False)
+def get_data() -> EnergyData:
     """Create initial dataset."""
-    data = {
-        "month_name": [calendar.month_abbr[i + 1] for i in range(12)],
-        "month_number": [i + 1 for i in range(12)],
-        "energy_produced": [
+    produced = np.asarray(
+        [
             30.86,
             30.02,
             60.77,
@@ -26,7 +84,10 @@ def get_data() -> pd.DataFrame:
             24.13,
             13,
         ],
-        "energy_fed_into_grid": [
+        dtype=np.float64,
+    )
+    fed = np.asarray(
+        [
             6.06,
             4.49,
             19.38,
@@ -40,23 +101,58 @@ def get_data() -> pd.DataFrame:
             3.61,
             2.31,
         ],
-    }
+        dtype=np.float64,
+    )
+    consumed = produced - fed
+    total_produced = float(produced.sum())
+    total_consumed = float(consumed.sum())
+    cost_saved = total_consumed * PRICE_PER_KWH
+
+    return EnergyData(
+        month_name=MONTH_NAMES,
+        produced=produced,
+        fed=fed,
+        consumed=consumed,
+        relative=consumed / produced * 100,
+        total_produced=total_produced,
+        total_consumed=total_consumed,
+        relative_average=total_consumed / total_produced * 100,
+        cost_saved=cost_saved,
+        statistics_text=(
+            f"{total_produced:.0f} kWh",
+            f"{total_consumed:.0f} kWh",
+            f"{cost_saved:.0f} €",
+        ),
+    )
 
-    df = pd.DataFrame(data)
-    df["energy_consumed"] = df["energy_produced"] - df["energy_fed_into_grid"]
-    df["energy_consumed_relative"] = df["energy_consumed"] / df["energy_produced"] * 100
 
-    return df
+def render_chart(figure_json: str) -> None:
+    """Render a serialized Plotly figure without serializing it again."""
+    config_json = json.dumps(PLOTLY_CONFIG)
+    components.html(
+        "<style>body { margin: 0; }</style>"
+        f'<script src="{PLOTLY_JS_URL}"></script>'
+        '<div id="chart" style="height: 100vh;"></div>'
+        f"<script>const figure = {figure_json};"
+        f'Plotly.newPlot("chart", figure.data, figure.layout, {config_json});'
+        "</script>",
+        height=CHART_HEIGHT,
+    )
 
 
-def plot_radar(df: pd.DataFrame) -> None:
-    """Plot radar chart of energy production and consumption."""
+@st.cache_data(show_spinner=False)
+def _radar_json(
+    month_name: tuple[str, ...], produced: tuple[float, ...], fed: tuple[float, ...]
+) -> str:
+    """Serialize radar chart of energy production and consumption."""
+    import plotly.graph_objects as go
+
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatterpolar(
-            r=df["energy_produced"],
-            theta=df["month_name"],
+            r=produced,
+            theta=month_name,
             fill="toself",
             name="Solar Energy Produced [kWh]",
             hovertemplate=("Month: %{theta}<br>Produced: %{r} kWh<extra></extra>"),
@@ -65,33 +161,39 @@ def plot_radar(df: pd.DataFrame) -> None:
 
     fig.add_trace(
         go.Scatterpolar(
-            r=df["energy_fed_into_grid"],
-            theta=df["month_name"],
+            r=fed,
+            theta=month_name,
             fill="toself",
             name="Solar Energy Fed Into Grid [kWh]",
             hovertemplate=("Month: %{theta}<br>Fed Into Grid: %{r} kWh<extra></extra>"),
         )
     )
 
-    fig.update_layout(
-        template="plotly_dark",
-        polar_angularaxis_rotation=90,
-        polar_angularaxis_direction="clockwise",
-        hovermode="x unified",
-        legend_orientation="h",
+    fig.update_layout(**RADAR_LAYOUT)
+
+    return fig.to_json()
+
+
+def plot_radar(data: EnergyData) -> None:
+    """Plot radar chart of energy production and consumption."""
+    render_chart(
+        _radar_json(data.month_name, tuple(data.produced), tuple(data.fed))
     )
 
-    st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(show_spinner=False)
+def _bar_json(
+    month_name: tuple[str, ...], relative: tuple[float, ...], relative_average: float
+) -> str:
+    """Serialize bar chart of relative self consumed energy."""
+    import plotly.graph_objects as go
 
-def plot_bar(df: pd.DataFrame) -> go.Figure:
-    """Plot bar chart of relative self consumed energy."""
     fig = go.Figure()
 
     fig.add_trace(
         go.Bar(
-            x=df["month_name"],
-            y=df["energy_consumed_relative"].round(2),
+            x=month_name,
+            y=[round(value, 2) for value in relative],
             name="Self-consumed Solar Energy [%]",
             hovertemplate=(
                 "Month: %{x}<br>" "Fraction of Energy Consumed: %{y}<extra></extra>"
@@ -99,14 +201,12 @@ def plot_bar(df: pd.DataFrame) -> go.Figure:
         )
     )
 
-    average_self_consumed_energy = round(
-        df["energy_consumed"].sum() / df["energy_produced"].sum() * 100, 2
-    )
+    average_self_consumed_energy = round(relative_average, 2)
 
     fig.add_trace(
         go.Scatter(
-            x=df["month_name"],
-            y=[average_self_consumed_energy] * 12,
+            x=[month_name[0], month_name[-1]],
+            y=[average_self_consumed_energy] * 2,
             name="Average Self-consumed Solar Energy [%]",
             line_color="red",
             line_dash="dot",
@@ -115,26 +215,29 @@ def plot_bar(df: pd.DataFrame) -> go.Figure:
         )
     )
 
-    fig.update_layout(showlegend=True, legend_orientation="h", legend_y=-0.15)
-    fig.update_yaxes(range=[0, 105], ticksuffix="%")
+    fig.update_layout(**BAR_LAYOUT)
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_json()
 
 
-def write_statistics(df: pd.DataFrame) -> None:
-    """Write summary statistics to screen."""
-    total_produced = df["energy_produced"].sum()
-    total_consumed = df["energy_consumed"].sum()
-    cost_saved = total_consumed * PRICE_PER_KWH
+def plot_bar(data: EnergyData) -> None:
+    """Plot bar chart of relative self consumed energy."""
+    render_chart(
+        _bar_json(data.month_name, tuple(data.relative), data.relative_average)
+    )
+
 
+def write_statistics(data: EnergyData) -> None:
+    """Write summary statistics to screen."""
+    produced_text, consumed_text, cost_saved_text = data.statistics_text
     col_one, col_two, col_three = st.columns(3)
 
     with col_one:
-        st.metric("Total Solar Energy Produced", f"{total_produced:.0f} kWh")
+        st.metric("Total Solar Energy Produced", produced_text)
     with col_two:
-        st.metric("Total Solar Energy Consumed", f"{total_consumed:.0f} kWh")
+        st.metric("Total Solar Energy Consumed", consumed_text)
     with col_three:
-        st.metric("Total Cost Savings", f"{cost_saved:.0f} €")
+        st.metric("Total Cost Savings", cost_saved_text)
 
 
 def main() -> None:
@@ -142,29 +245,21 @@ def main() -> None:
     st.set_page_config(page_title="Balcony Solar", page_icon="☀️")
 
     st.title("Balcony Solar Statistics")
-    st.markdown(
-        'I tracked the energy production (and consumption) of my "Balkonkraftwerk" over a '
-        "full year. For the energy fed into grid I do not get disbursement so I tried to "
-        "self-consume as much energy as possible. Here are the results:"
-    )
+    st.markdown(INTRO_MD)
 
-    df = get_data()
+    data = get_data()
 
     st.subheader("Energy Consumed and Fed Into Grid")
-    plot_radar(df)
+    plot_radar(data)
 
     st.subheader("Self-consumed Energy")
-    plot_bar(df)
+    plot_bar(data)
 
     st.subheader("Year Statistics")
-    write_statistics(df)
+    write_statistics(data)
 
     st.subheader("Conclusion")
-    st.markdown(
-        "I was able to self-consume about 70% of the energy produced by my solar panels over "
-        "the year. This number is highly dependent on the own energy consumption curve and might "
-        "be optimized further, e.g. by charging electrical devices during daytime and not at night."
-    )
+    st.markdown(CONCLUSION_MD)
 
 
 if __name__ == "__main__":